@@ -29,6 +29,7 @@ Features:
         'views/trip_views.xml',
         'views/maintenance_views.xml',
         'views/expense_views.xml',
+        'views/fuel_statement_views.xml',
         'views/analytics_views.xml',
         'views/dashboard_views.xml',
         'views/config_views.xml',
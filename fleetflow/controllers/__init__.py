@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+from . import export
+from . import main
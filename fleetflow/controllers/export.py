@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from odoo import http
+from odoo.addons.web.controllers.export import CSVExport, ExcelExport
+
+
+# Exports are pure reads: route them to the replica cursor when one is
+# configured. A request that still needs to write is replayed by Odoo on
+# a read/write cursor, so this is safe for any model.
+class FleetFlowCSVExport(CSVExport):
+
+    @http.route(readonly=True)
+    def web_export_csv(self, data):
+        return super().web_export_csv(data)
+
+
+class FleetFlowExcelExport(ExcelExport):
+
+    @http.route(readonly=True)
+    def web_export_xlsx(self, data):
+        return super().web_export_xlsx(data)
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from werkzeug.exceptions import BadRequest
+
+from odoo import http
+from odoo.exceptions import AccessError, UserError
+from odoo.http import request
+from odoo.tools import SQL
+
+from odoo.addons.fleetflow.models.sync_tombstone import TOMBSTONE_RETENTION_DAYS
+
+SYNC_PAGE_SIZE = 200
+SYNC_MAX_PAGE_SIZE = 1000
+# Longest a transaction may run: rows stamped within this window before
+# now may still be uncommitted, so watermarks never settle inside it.
+SYNC_OVERLAP = timedelta(minutes=5)
+
+DRIVER_SYNC_FIELDS = [
+    'id', 'name', 'phone', 'license_number', 'license_expiry_date',
+    'license_status', 'status', 'safety_score',
+]
+VEHICLE_SYNC_FIELDS = [
+    'id', 'name', 'license_plate', 'vehicle_type', 'max_load_capacity',
+    'odometer', 'state',
+]
+TRIP_SYNC_FIELDS = [
+    'id', 'name', 'vehicle_id', 'origin', 'destination', 'date_planned',
+    'date_completed', 'cargo_description', 'cargo_weight', 'distance_km',
+    'odometer_start', 'odometer_end', 'state',
+]
+
+
+def _parse_stamp(value):
+    """Naive UTC timestamp from a watermark string, microseconds kept."""
+    stamp = datetime.fromisoformat(value)
+    if stamp.tzinfo:
+        raise ValueError('Watermarks are naive UTC timestamps.')
+    return stamp
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _completion_error(completion):
+    """Why a pushed completion entry is malformed, or None."""
+    if not isinstance(completion, dict):
+        return 'Completion entries must be objects.'
+    if not isinstance(completion.get('trip_id'), int) or isinstance(
+            completion.get('trip_id'), bool):
+        return 'trip_id must be an integer.'
+    if not _is_number(completion.get('odometer_end')):
+        return 'odometer_end must be a number.'
+    if completion.get('odometer_start') is not None and not _is_number(
+            completion['odometer_start']):
+        return 'odometer_start must be a number.'
+    return None
+
+
+def _pack(records, field_names):
+    """Columnar {'fields': [...], 'rows': [[...]]}; many2one → bare id."""
+    rows = []
+    for values in records.read(field_names, load=None):
+        rows.append([values[name] for name in field_names])
+    return {'fields': field_names, 'rows': rows}
+
+
+class FleetFlowDriverSync(http.Controller):
+
+    def _current_driver(self):
+        driver = request.env['fleetflow.driver'].sudo().search(
+            [('employee_id.user_id', '=', request.env.uid)], limit=1)
+        if not driver:
+            raise AccessError('Your user is not linked to a FleetFlow driver profile.')
+        return driver
+
+    def _keyset_page(self, table, stamp_column, driver_id, after, limit):
+        """
+        Rows of `table` for the driver past the (stamp, id) keyset, at full
+        timestamp precision. Returns ([(id, stamp)], has_more).
+        """
+        keyset = SQL('TRUE')
+        if after:
+            keyset = SQL('(%s, id) > (%s, %s)',
+                         SQL.identifier(stamp_column), after[0], after[1])
+        request.env.cr.execute(SQL(
+            """SELECT id, %s FROM %s
+                WHERE driver_id = %s AND %s
+             ORDER BY %s, id
+                LIMIT %s""",
+            SQL.identifier(stamp_column), SQL.identifier(table),
+            driver_id, keyset, SQL.identifier(stamp_column), limit + 1,
+        ))
+        rows = request.env.cr.fetchall()
+        return rows[:limit], len(rows) > limit
+
+    def _resume_point(self, rows, has_more, horizon):
+        """
+        Watermark to hand back for a keyset stream. While has_more, it is
+        the exact last key so paging always advances. On the last page it
+        is the overlap horizon: write_date/create_date are transaction
+        start times, so a transaction still running now may commit rows
+        stamped earlier than what this page returned. Settling on the
+        horizon also keeps a quiet stream's watermark moving forward.
+        """
+        last = (rows[-1][1], rows[-1][0]) if has_more else (horizon, 0)
+        return [last[0].isoformat(sep=' '), last[1]]
+
+    # ─── PULL: changes since the client's watermark ────────────────
+    @http.route('/fleetflow/sync/pull', type='http', auth='user',
+                methods=['GET'], readonly=True)
+    def sync_pull(self, trip_write_date=None, trip_id=0, tombstone_date=None,
+                  tombstone_id=0, profile_write_date=None, limit=SYNC_PAGE_SIZE,
+                  **kw):
+        """
+        One page of the driver's delta. Clients apply tombstones before
+        trips, call again with the returned watermark while has_more is
+        true, and store the final watermark for the next sync. Pass no
+        watermark for a full initial sync. Records near the end of the
+        stream may be sent twice; clients upsert by id.
+
+        When `reset` is true the client's watermark predates tombstone
+        retention: it must drop every local trip, vehicle and profile
+        before applying the page, which starts a full sync.
+        """
+        try:
+            limit = max(1, min(int(limit), SYNC_MAX_PAGE_SIZE))
+            trip_after = trip_write_date and (
+                _parse_stamp(trip_write_date), int(trip_id))
+            tombstone_after = tombstone_date and (
+                _parse_stamp(tombstone_date), int(tombstone_id))
+            since = profile_write_date and _parse_stamp(profile_write_date)
+        except (TypeError, ValueError):
+            raise BadRequest('Invalid sync watermark or page size.')
+
+        driver = self._current_driver()
+        Trip = request.env['fleetflow.trip'].sudo()
+        now = request.env.cr.now()
+        horizon = now - SYNC_OVERLAP
+        # Deletions older than the retention window are gone: a client
+        # that far behind can only be brought back by a full resync.
+        retention_limit = now - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        reset = any(after and after[0] < retention_limit
+                    for after in (trip_after, tombstone_after))
+        if reset:
+            trip_after = tombstone_after = since = None
+        Trip.flush_model(['driver_id', 'write_date'])
+
+        trip_rows, trips_more = self._keyset_page(
+            'fleetflow_trip', 'write_date', driver.id, trip_after, limit)
+        trips = Trip.browse([row[0] for row in trip_rows])
+
+        tombstone_rows, tombstones_more = self._keyset_page(
+            'fleetflow_sync_tombstone', 'create_date', driver.id,
+            tombstone_after, limit)
+        tombstones = request.env['fleetflow.sync.tombstone'].sudo().browse(
+            [row[0] for row in tombstone_rows])
+        # A trip reassigned back to this driver must not be deleted again
+        # by a tombstone from an earlier reassignment.
+        reassigned_back = set(Trip.search([
+            ('id', 'in', tombstones.filtered(
+                lambda t: t.res_model == Trip._name).mapped('res_id')),
+            ('driver_id', '=', driver.id),
+        ]).ids)
+
+        # Profile and vehicles: only what changed, plus vehicles the page needs
+        def changed_since(records):
+            return records.filtered(lambda r: not since or r.write_date > since)
+
+        profile = changed_since(driver)
+        open_vehicles = changed_since(Trip.search([
+            ('driver_id', '=', driver.id),
+            ('state', 'in', ('draft', 'dispatched')),
+        ]).vehicle_id)
+        vehicles = trips.vehicle_id | open_vehicles
+
+        trip_mark = self._resume_point(trip_rows, trips_more, horizon)
+        tombstone_mark = self._resume_point(tombstone_rows, tombstones_more, horizon)
+        payload = {
+            'reset': reset,
+            'driver': _pack(profile, DRIVER_SYNC_FIELDS),
+            'vehicles': _pack(vehicles, VEHICLE_SYNC_FIELDS),
+            'trips': _pack(trips, TRIP_SYNC_FIELDS),
+            'tombstones': [
+                [t.res_model, t.res_id] for t in tombstones
+                if not (t.res_model == Trip._name and t.res_id in reassigned_back)
+            ],
+            'watermark': {
+                'trip_write_date': trip_mark[0],
+                'trip_id': trip_mark[1],
+                'tombstone_date': tombstone_mark[0],
+                'tombstone_id': tombstone_mark[1],
+                # Settles on the horizon like the keyset streams; anything
+                # changed inside the window is simply re-sent next time.
+                'profile_write_date': horizon.isoformat(sep=' '),
+            },
+            'has_more': trips_more or tombstones_more,
+        }
+        body = json.dumps(payload, default=str, separators=(',', ':')).encode()
+        headers = [('Content-Type', 'application/json'), ('Vary', 'Accept-Encoding')]
+        if 'gzip' in request.httprequest.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers.append(('Content-Encoding', 'gzip'))
+        return request.make_response(body, headers)
+
+    # ─── PUSH: batched trip completions ────────────────────────────
+    @http.route('/fleetflow/sync/push', type='json', auth='user', methods=['POST'])
+    def sync_push(self, completions=None, **kw):
+        """
+        completions: [{'trip_id': int, 'odometer_end': float,
+                       'odometer_start': float (optional)}, ...]
+
+        Each entry goes through action_complete in its own savepoint.
+        Replaying a batch is harmless: trips already completed are
+        acknowledged as 'already_completed' instead of failing.
+        Malformed entries get status 'error' without affecting the rest.
+        """
+        if not isinstance(completions, list):
+            raise BadRequest('completions must be a list.')
+        driver = self._current_driver()
+        entries = [(c, _completion_error(c)) for c in completions]
+        trips = request.env['fleetflow.trip'].sudo().search([
+            ('id', 'in', [c['trip_id'] for c, error in entries if not error]),
+            ('driver_id', '=', driver.id),
+        ])
+        trips_by_id = {trip.id: trip for trip in trips}
+        results = []
+        for completion, error in entries:
+            if error:
+                trip_id = completion.get('trip_id') if isinstance(completion, dict) else None
+                results.append({'trip_id': trip_id, 'status': 'error', 'message': error})
+                continue
+            trip = trips_by_id.get(completion['trip_id'])
+            result = {'trip_id': completion['trip_id']}
+            if not trip:
+                result.update(status='error', message='Trip not found for this driver.')
+            elif trip.state == 'completed':
+                result.update(status='already_completed')
+            else:
+                try:
+                    with request.env.cr.savepoint():
+                        vals = {'odometer_end': completion['odometer_end']}
+                        if completion.get('odometer_start') is not None:
+                            vals['odometer_start'] = completion['odometer_start']
+                        trip.write(vals)
+                        trip.action_complete()
+                    result.update(status='completed')
+                except UserError as err:
+                    result.update(status='error', message=str(err))
+            results.append(result)
+        return {'results': results}
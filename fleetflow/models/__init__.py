@@ -4,3 +4,5 @@ from . import driver
 from . import trip
 from . import maintenance
 from . import expense
+from . import fuel_statement_import
+from . import sync_tombstone
@@ -9,9 +9,11 @@ class FleetFlowDriver(models.Model):
     _description = 'FleetFlow Driver Profile'
     _inherit = ['mail.thread', 'mail.activity.mixin']
     _order = 'name asc'
+    _rec_names_search = ['name', 'license_number']
 
     # ─── PERSONAL INFO ─────────────────────────────────────────────
-    name = fields.Char(string='Full Name', required=True, tracking=True)
+    name = fields.Char(
+        string='Full Name', required=True, tracking=True, index='trigram')
     phone = fields.Char(string='Phone Number')
     email = fields.Char(string='Email')
     employee_id = fields.Many2one(
@@ -20,7 +22,7 @@ class FleetFlowDriver(models.Model):
 
     # ─── LICENSE & COMPLIANCE ──────────────────────────────────────
     license_number = fields.Char(
-        string='License Number', required=True, copy=False)
+        string='License Number', required=True, copy=False, index='trigram')
     license_expiry_date = fields.Date(
         string='License Expiry Date', required=True, tracking=True)
     license_categories = fields.Many2many(
@@ -53,6 +53,11 @@ class FleetFlowExpense(models.Model):
     )
 
     notes = fields.Char(string='Notes')
+    card_reference = fields.Char(
+        string='Fuel Card Reference',
+        copy=False,
+        help='Transaction reference from an imported fuel-card statement.',
+    )
 
     # ─── AUTO-CALCULATE FUEL COST ──────────────────────────────────
     @api.depends('liters', 'price_per_liter', 'expense_type')
@@ -63,3 +68,8 @@ class FleetFlowExpense(models.Model):
                     and expense.price_per_liter):
                 expense.cost = expense.liters * expense.price_per_liter
             # else: user enters cost manually (leave unchanged)
+
+    _sql_constraints = [
+        ('card_reference_unique', 'UNIQUE(card_reference)',
+         'This fuel-card transaction has already been imported!'),
+    ]
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+import base64
+import csv
+import io
+import re
+from collections import defaultdict
+from datetime import datetime
+from itertools import groupby
+
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+
+REQUIRED_COLUMNS = ('date', 'license_plate', 'liters', 'price_per_liter', 'amount')
+CREATE_BATCH_SIZE = 1000
+REFERENCE_BATCH_SIZE = 5000
+# Card providers export ISO or day-first dates; month-first is not accepted
+# because it is ambiguous with day-first.
+STATEMENT_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y')
+
+
+def _normalize_plate(plate):
+    """'gj-01 ab 1234' → 'GJ01AB1234' so card and registry spellings agree."""
+    return re.sub(r'[^0-9A-Z]', '', (plate or '').upper())
+
+
+def _parse_statement_date(value):
+    value = (value or '').strip()
+    for date_format in STATEMENT_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"unrecognised date '{value}' (use YYYY-MM-DD or DD/MM/YYYY)")
+
+
+def _match_trips(transactions, trips):
+    """
+    Sort-merge join of statement rows onto trip intervals.
+
+    transactions: dicts with 'vehicle_id' and 'date', sorted by
+                  (vehicle_id, date)
+    trips:        (vehicle_id, start, end, trip_id) tuples, in any order
+
+    A vehicle is on at most one trip at a time, so for each row the
+    candidate is the latest trip that started on or before its date;
+    it matches when the row also falls before that trip's end.
+    Sets 'trip_id' on every transaction (False when unmatched).
+    """
+    trips_by_vehicle = defaultdict(list)
+    for trip in trips:
+        trips_by_vehicle[trip[0]].append(trip)
+    for intervals in trips_by_vehicle.values():
+        intervals.sort(key=lambda t: (t[1], t[3]))
+    for vehicle_id, rows in groupby(transactions, key=lambda r: r['vehicle_id']):
+        intervals = trips_by_vehicle.get(vehicle_id, [])
+        pos = -1
+        for row in rows:
+            while pos + 1 < len(intervals) and intervals[pos + 1][1] <= row['date']:
+                pos += 1
+            row['trip_id'] = (
+                intervals[pos][3]
+                if pos >= 0 and row['date'] <= intervals[pos][2]
+                else False
+            )
+
+
+class FleetFlowFuelStatementImport(models.TransientModel):
+    _name = 'fleetflow.fuel.statement.import'
+    _description = 'FleetFlow Fuel-Card Statement Reconciliation'
+
+    statement_file = fields.Binary(string='Statement (CSV)', required=True)
+    statement_filename = fields.Char(string='File Name')
+    require_trip = fields.Boolean(
+        string='Only Import Rows Matched to a Trip',
+        help='When set, rows that match a vehicle but no trip are reported '
+             'as exceptions instead of being logged against the vehicle.',
+    )
+
+    # ─── RESULTS ───────────────────────────────────────────────────
+    state = fields.Selection([
+        ('upload', 'Upload'),
+        ('done',   'Done'),
+    ], default='upload')
+    rows_total = fields.Integer(string='Rows Read', readonly=True)
+    rows_imported = fields.Integer(string='Expenses Created', readonly=True)
+    rows_matched_trip = fields.Integer(string='Matched to a Trip', readonly=True)
+    rows_exception = fields.Integer(string='Exceptions', readonly=True)
+    exception_file = fields.Binary(string='Exceptions Report', readonly=True)
+    exception_filename = fields.Char(readonly=True)
+
+    # ─── PARSING ───────────────────────────────────────────────────
+    def _iter_statement_rows(self):
+        """Stream the CSV, yielding (line_no, row, parsed|None, error|None)."""
+        raw = base64.b64decode(self.statement_file)
+        stream = io.TextIOWrapper(io.BytesIO(raw), encoding='utf-8-sig', newline='')
+        reader = csv.DictReader(stream)
+        header = [h.strip().lower() for h in (reader.fieldnames or [])]
+        missing = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing:
+            raise UserError(
+                f"The statement is missing required column(s): {', '.join(missing)}.\n"
+                f"Expected: {', '.join(REQUIRED_COLUMNS)} (+ optional reference, station)."
+            )
+        reader.fieldnames = header
+        for line_no, row in enumerate(reader, start=2):
+            try:
+                liters = float(row['liters'] or 0.0)
+                price = float(row['price_per_liter'] or 0.0)
+                amount = float(row['amount'] or 0.0) or liters * price
+                parsed = {
+                    'date': _parse_statement_date(row['date']),
+                    'plate': _normalize_plate(row['license_plate']),
+                    'liters': liters,
+                    'price_per_liter': price,
+                    'amount': amount,
+                    'reference': (row.get('reference') or '').strip() or False,
+                    'station': (row.get('station') or '').strip(),
+                }
+            except (ValueError, TypeError, AttributeError) as err:
+                yield line_no, row, None, f'Unreadable row: {err}'
+                continue
+            if not parsed['date'] or not parsed['plate']:
+                yield line_no, row, None, 'Missing date or license plate'
+                continue
+            yield line_no, row, parsed, None
+
+    def _existing_references(self, references):
+        Expense = self.env['fleetflow.expense'].with_context(active_test=False)
+        references = list(references)
+        existing = set()
+        for start in range(0, len(references), REFERENCE_BATCH_SIZE):
+            chunk = references[start:start + REFERENCE_BATCH_SIZE]
+            existing.update(
+                r['card_reference'] for r in Expense.search_read(
+                    [('card_reference', 'in', chunk)], ['card_reference'])
+            )
+        return existing
+
+    def _load_trip_intervals(self, vehicle_ids, date_from, date_to):
+        """Dispatched/completed trips as (vehicle, start, end, id) tuples."""
+        trips = self.env['fleetflow.trip'].search_read(
+            [('vehicle_id', 'in', list(vehicle_ids)),
+             ('state', 'in', ('dispatched', 'completed')),
+             ('date_planned', '<=', date_to),
+             '|', ('date_completed', '=', False),
+                  ('date_completed', '>=', date_from)],
+            ['vehicle_id', 'date_planned', 'date_completed'],
+        )
+        return [
+            (t['vehicle_id'][0], t['date_planned'],
+             t['date_completed'] or date_to, t['id'])
+            for t in trips
+        ]
+
+    # ─── RECONCILIATION ────────────────────────────────────────────
+    def action_reconcile(self):
+        self.ensure_one()
+        vehicle_by_plate = {
+            _normalize_plate(v['license_plate']): v['id']
+            for v in self.env['fleetflow.vehicle'].search_read(
+                [], ['license_plate'])
+        }
+
+        exceptions = []
+        transactions = []
+        seen_refs = set()
+        rows_total = 0
+        for line_no, row, parsed, error in self._iter_statement_rows():
+            rows_total += 1
+            if error:
+                exceptions.append((line_no, row, error))
+                continue
+            vehicle_id = vehicle_by_plate.get(parsed['plate'])
+            if not vehicle_id:
+                exceptions.append((line_no, row, 'Unknown license plate'))
+                continue
+            if parsed['reference']:
+                if parsed['reference'] in seen_refs:
+                    exceptions.append((line_no, row, 'Duplicate reference in statement'))
+                    continue
+                seen_refs.add(parsed['reference'])
+            parsed.update(line_no=line_no, row=row, vehicle_id=vehicle_id)
+            transactions.append(parsed)
+
+        already_imported = self._existing_references(seen_refs)
+        if already_imported:
+            kept = []
+            for txn in transactions:
+                if txn['reference'] in already_imported:
+                    exceptions.append((txn['line_no'], txn['row'], 'Already imported'))
+                else:
+                    kept.append(txn)
+            transactions = kept
+
+        if transactions:
+            transactions.sort(key=lambda t: (t['vehicle_id'], t['date']))
+            trips = self._load_trip_intervals(
+                {t['vehicle_id'] for t in transactions},
+                min(t['date'] for t in transactions),
+                max(t['date'] for t in transactions),
+            )
+            _match_trips(transactions, trips)
+
+        vals_list = []
+        matched_trip = 0
+        for txn in transactions:
+            if txn['trip_id']:
+                matched_trip += 1
+            elif self.require_trip:
+                exceptions.append((txn['line_no'], txn['row'], 'No trip on this date'))
+                continue
+            vals_list.append({
+                'name': f"Fuel — {txn['station']}" if txn['station'] else 'Fuel',
+                'vehicle_id': txn['vehicle_id'],
+                'trip_id': txn['trip_id'],
+                'expense_type': 'fuel',
+                'date': txn['date'],
+                'liters': txn['liters'],
+                'price_per_liter': txn['price_per_liter'],
+                'cost': txn['amount'],
+                'card_reference': txn['reference'],
+            })
+
+        Expense = self.env['fleetflow.expense'].with_context(
+            tracking_disable=True, mail_create_nolog=True)
+        for start in range(0, len(vals_list), CREATE_BATCH_SIZE):
+            Expense.create(vals_list[start:start + CREATE_BATCH_SIZE])
+
+        exceptions.sort(key=lambda e: e[0])
+        self.write({
+            'state': 'done',
+            'rows_total': rows_total,
+            'rows_imported': len(vals_list),
+            'rows_matched_trip': matched_trip,
+            'rows_exception': len(exceptions),
+            'exception_file': self._build_exception_report(exceptions),
+            'exception_filename': 'fuel_statement_exceptions.csv',
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    @api.model
+    def _build_exception_report(self, exceptions):
+        if not exceptions:
+            return False
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(['line', 'reason'] + list(REQUIRED_COLUMNS) + ['reference'])
+        for line_no, row, reason in exceptions:
+            writer.writerow(
+                [line_no, reason]
+                + [row.get(c, '') for c in REQUIRED_COLUMNS]
+                + [row.get('reference', '')]
+            )
+        return base64.b64encode(out.getvalue().encode('utf-8'))
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools.sql import create_index
+
+TOMBSTONE_RETENTION_DAYS = 90
+
+
+class FleetFlowSyncTombstone(models.Model):
+    _name = 'fleetflow.sync.tombstone'
+    _description = 'FleetFlow Mobile Sync Tombstone'
+    _order = 'id'
+
+    res_model = fields.Char(string='Model', required=True)
+    res_id = fields.Integer(string='Record ID', required=True)
+    driver_id = fields.Many2one(
+        'fleetflow.driver',
+        string='Driver',
+        required=True,
+        ondelete='cascade',
+        help='Driver whose device must drop this record.',
+    )
+
+    def _auto_init(self):
+        res = super()._auto_init()
+        # Keyset for the driver app's delta sync: (create_date, id) per driver
+        create_index(self._cr, 'fleetflow_sync_tombstone_driver_sync_idx',
+                     self._table, ['driver_id', 'create_date', 'id'])
+        return res
+
+    @api.model
+    def _record(self, records):
+        """Remember that `records` left their current driver's device."""
+        records = records.filtered('driver_id')
+        if records:
+            self.sudo().create([{
+                'res_model': rec._name,
+                'res_id': rec.id,
+                'driver_id': rec.driver_id.id,
+            } for rec in records])
+
+    @api.autovacuum
+    def _gc_tombstones(self):
+        limit = fields.Datetime.now() - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        self.sudo().search([('create_date', '<', limit)]).unlink()
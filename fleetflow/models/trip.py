@@ -1,14 +1,23 @@
 # -*- coding: utf-8 -*-
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError, UserError
+from odoo.osv import expression
+from odoo.tools.sql import create_index
 from datetime import date
 
+FEED_PAGE_SIZE = 50
+FEED_MAX_PAGE_SIZE = 200
+FEED_FIELDS = [
+    'name', 'vehicle_id', 'driver_id', 'origin', 'destination',
+    'cargo_weight', 'state', 'date_planned',
+]
+
 
 class FleetFlowTrip(models.Model):
     _name = 'fleetflow.trip'
     _description = 'FleetFlow Trip'
     _inherit = ['mail.thread', 'mail.activity.mixin']
-    _order = 'date_planned desc'
+    _order = 'date_planned desc, id desc'
 
     # ─── IDENTIFICATION ────────────────────────────────────────────
     name = fields.Char(
@@ -77,6 +86,17 @@ class FleetFlowTrip(models.Model):
         store=True
     )
 
+    # ─── INDEXES ───────────────────────────────────────────────────
+    def _auto_init(self):
+        res = super()._auto_init()
+        # Keyset for the driver app's delta sync: (write_date, id) per driver
+        create_index(self._cr, 'fleetflow_trip_driver_sync_idx', self._table,
+                     ['driver_id', 'write_date', 'id'])
+        # Keyset for the dashboard trip feed, matching _order
+        create_index(self._cr, 'fleetflow_trip_date_planned_id_idx', self._table,
+                     ['date_planned DESC', 'id DESC'])
+        return res
+
     # ─── SEQUENCE ON CREATE ────────────────────────────────────────
     @api.model_create_multi
     def create(self, vals_list):
@@ -86,6 +106,57 @@ class FleetFlowTrip(models.Model):
                     'fleetflow.trip') or 'New'
         return super().create(vals_list)
 
+    # ─── MOBILE SYNC TOMBSTONES ────────────────────────────────────
+    def write(self, vals):
+        if 'driver_id' in vals:
+            # Reassigned trips must disappear from the previous driver's app
+            self.env['fleetflow.sync.tombstone']._record(
+                self.filtered(lambda t: t.driver_id.id != vals['driver_id']))
+        return super().write(vals)
+
+    def unlink(self):
+        self.env['fleetflow.sync.tombstone']._record(self)
+        return super().unlink()
+
+    # ─── DASHBOARD FEED ────────────────────────────────────────────
+    @api.model
+    @api.readonly
+    def get_dashboard_trip_feed(self, search=None, state=None, after=None,
+                                limit=FEED_PAGE_SIZE):
+        """
+        One page of the Command Center trip feed, newest first.
+        `after` is the [date_planned, id] cursor returned with the previous
+        page; seeking past it keeps deep pages as cheap as the first one.
+        """
+        domain = [('state', '=', state)] if state else [
+            ('state', 'in', ('draft', 'dispatched', 'completed'))]
+        if search:
+            domain = expression.AND([domain, [
+                '|', '|', '|', '|',
+                ('name', 'ilike', search),
+                ('origin', 'ilike', search),
+                ('destination', 'ilike', search),
+                ('vehicle_id', 'ilike', search),
+                ('driver_id', 'ilike', search),
+            ]])
+        if after:
+            date_planned, trip_id = after
+            # The leading <= is what Postgres can use as the index range
+            # bound; the OR only trims ties on the cursor date.
+            domain = expression.AND([domain, [
+                ('date_planned', '<=', date_planned),
+                '|', ('date_planned', '<', date_planned), ('id', '<', trip_id),
+            ]])
+        limit = max(1, min(int(limit), FEED_MAX_PAGE_SIZE))
+        trips = self.search_read(domain, FEED_FIELDS, limit=limit + 1,
+                                 order='date_planned desc, id desc')
+        has_more = len(trips) > limit
+        trips = trips[:limit]
+        return {
+            'trips': trips,
+            'next': has_more and [trips[-1]['date_planned'], trips[-1]['id']],
+        }
+
     # ─── COMPUTED ──────────────────────────────────────────────────
     @api.depends('cargo_weight', 'vehicle_id.max_load_capacity')
     def _compute_capacity_warning(self):
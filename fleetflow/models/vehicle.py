@@ -8,18 +8,21 @@ class FleetFlowVehicle(models.Model):
     _description = 'FleetFlow Vehicle Registry'
     _inherit = ['mail.thread', 'mail.activity.mixin']
     _order = 'name asc'
+    _rec_names_search = ['name', 'license_plate']
 
     # ─── BASIC INFO ────────────────────────────────────────────────
     name = fields.Char(
         string='Vehicle Name / Model',
         required=True,
         tracking=True,
+        index='trigram',
     )
     license_plate = fields.Char(
         string='License Plate',
         required=True,
         copy=False,
         tracking=True,
+        index='trigram',
     )
     vehicle_type = fields.Selection([
         ('truck', 'Truck'),
@@ -174,6 +177,27 @@ class FleetFlowVehicle(models.Model):
          'Max load capacity must be greater than 0 kg!'),
     ]
 
+    # ─── COMMAND CENTER ────────────────────────────────────────────
+    @api.model
+    @api.readonly
+    def get_dashboard_data(self):
+        """
+        KPI counters for the Command Center in one round-trip.
+        Read-only: runs on the replica cursor when db_replica_host is
+        configured, on the primary otherwise.
+        """
+        counts = dict(self._read_group([], ['state'], ['__count']))
+        on_trip = counts.get('on_trip', 0)
+        total = sum(n for state, n in counts.items() if state != 'retired')
+        return {
+            'activeFleet': on_trip,
+            'maintenanceAlert': counts.get('in_shop', 0),
+            'totalVehicles': total,
+            'pendingCargo': self.env['fleetflow.trip'].search_count(
+                [('state', '=', 'draft')]),
+            'utilizationRate': round(on_trip / total * 100) if total else 0,
+        }
+
     # ─── BUTTONS / ACTIONS ─────────────────────────────────────────
     def action_set_available(self):
         for rec in self:
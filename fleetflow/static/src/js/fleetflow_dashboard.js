@@ -2,7 +2,15 @@
 
 import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
-import { Component, useState, onWillStart, onMounted } from "@odoo/owl";
+import { useDebounced } from "@web/core/utils/timing";
+import { Component, useState, useRef, onWillStart, onMounted } from "@odoo/owl";
+
+// Trip feed virtualization: rows have a fixed height so only the visible
+// window (plus overscan) is rendered, however deep the user scrolls.
+const FEED_ROW_HEIGHT = 48;
+const FEED_VIEWPORT_HEIGHT = 480;
+const FEED_OVERSCAN = 8;
+const FEED_PAGE_SIZE = 50;
 
 class FleetFlowDashboard extends Component {
     static template = "fleetflow.Dashboard";
@@ -17,53 +25,115 @@ class FleetFlowDashboard extends Component {
             utilizationRate: 0,
             pendingCargo: 0,
             totalVehicles: 0,
-            recentTrips: [],
             loading: true,
+            feed: {
+                rows: [],
+                cursor: false,
+                done: false,
+                loading: false,
+                search: "",
+                stateFilter: "",
+                scrollTop: 0,
+            },
         });
+        this.feedRef = useRef("feed");
+        this.feedRequest = 0;
+        this.feedHeaderHeight = 0;
+        this.onFeedSearch = useDebounced((ev) => {
+            this.state.feed.search = ev.target.value.trim();
+            this.loadFeed(true);
+        }, 300);
 
         onWillStart(async () => {
-            await this.loadDashboardData();
+            await Promise.all([this.loadDashboardData(), this.loadFeed(true)]);
+        });
+        onMounted(() => {
+            const head = this.feedRef.el && this.feedRef.el.querySelector("thead");
+            this.feedHeaderHeight = head ? head.offsetHeight : 0;
         });
     }
 
     async loadDashboardData() {
-        // Active Fleet (On Trip)
-        const onTrip = await this.orm.searchCount("fleetflow.vehicle", [
-            ["state", "=", "on_trip"],
-        ]);
-        // In Shop
-        const inShop = await this.orm.searchCount("fleetflow.vehicle", [
-            ["state", "=", "in_shop"],
-        ]);
-        // Total vehicles
-        const total = await this.orm.searchCount("fleetflow.vehicle", [
-            ["state", "!=", "retired"],
-        ]);
-        // Pending Cargo (draft trips)
-        const pending = await this.orm.searchCount("fleetflow.trip", [
-            ["state", "=", "draft"],
-        ]);
-
-        // Recent trips
-        const trips = await this.orm.searchRead(
-            "fleetflow.trip",
-            [["state", "in", ["draft", "dispatched", "completed"]]],
-            ["name", "vehicle_id", "driver_id", "origin", "destination",
-             "cargo_weight", "state", "date_planned"],
-            { limit: 8, order: "date_planned desc" }
+        // Single read-only call: served from the DB replica when one is configured
+        const data = await this.orm.call(
+            "fleetflow.vehicle", "get_dashboard_data", []
         );
-
-        this.state.activeFleet = onTrip;
-        this.state.maintenanceAlert = inShop;
-        this.state.totalVehicles = total;
-        this.state.pendingCargo = pending;
-        this.state.utilizationRate = total > 0
-            ? Math.round((onTrip / total) * 100)
-            : 0;
-        this.state.recentTrips = trips;
+        Object.assign(this.state, data);
         this.state.loading = false;
     }
 
+    // ── TRIP FEED ───────────────────────────────────────────────
+    async loadFeed(reset = false) {
+        const feed = this.state.feed;
+        if (reset) {
+            feed.rows = [];
+            feed.cursor = false;
+            feed.done = false;
+            feed.scrollTop = 0;
+            if (this.feedRef.el) {
+                this.feedRef.el.scrollTop = 0;
+            }
+        } else if (feed.done || feed.loading) {
+            return;
+        }
+        // Drop responses that a newer filter change has superseded
+        const request = ++this.feedRequest;
+        feed.loading = true;
+        try {
+            const page = await this.orm.call(
+                "fleetflow.trip", "get_dashboard_trip_feed", [], {
+                    search: feed.search,
+                    state: feed.stateFilter || false,
+                    after: feed.cursor,
+                    limit: FEED_PAGE_SIZE,
+                }
+            );
+            if (request === this.feedRequest) {
+                feed.rows.push(...page.trips);
+                feed.cursor = page.next;
+                feed.done = !page.next;
+            }
+        } finally {
+            // A failed call must not block further scroll loads
+            if (request === this.feedRequest) {
+                feed.loading = false;
+            }
+        }
+    }
+
+    // The sticky <thead> sits inside the scroll container: body row i
+    // starts at feedHeaderHeight + i * FEED_ROW_HEIGHT and the header
+    // covers the top feedHeaderHeight pixels of the viewport.
+    get feedWindow() {
+        const { rows, scrollTop } = this.state.feed;
+        const start = Math.max(
+            0, Math.floor(scrollTop / FEED_ROW_HEIGHT) - FEED_OVERSCAN);
+        const end = Math.min(
+            rows.length,
+            Math.ceil((scrollTop + FEED_VIEWPORT_HEIGHT - this.feedHeaderHeight)
+                / FEED_ROW_HEIGHT) + FEED_OVERSCAN);
+        return {
+            rows: rows.slice(start, end),
+            padTop: start * FEED_ROW_HEIGHT,
+            padBottom: (rows.length - end) * FEED_ROW_HEIGHT,
+        };
+    }
+
+    onFeedScroll(ev) {
+        const feed = this.state.feed;
+        feed.scrollTop = ev.target.scrollTop;
+        const remaining = this.feedHeaderHeight + feed.rows.length * FEED_ROW_HEIGHT
+            - (feed.scrollTop + FEED_VIEWPORT_HEIGHT);
+        if (remaining < FEED_OVERSCAN * FEED_ROW_HEIGHT) {
+            this.loadFeed();
+        }
+    }
+
+    onFeedStateFilter(ev) {
+        this.state.feed.stateFilter = ev.target.value;
+        this.loadFeed(true);
+    }
+
     // ── NAVIGATION ──────────────────────────────────────────────
     openNewTrip() {
         this.action.doAction({
@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+from . import test_fuel_statement_import
+from . import test_sync
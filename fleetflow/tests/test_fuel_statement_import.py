@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+import base64
+import csv
+import io
+from datetime import date
+
+from odoo.tests import BaseCase, TransactionCase, tagged
+
+from odoo.addons.fleetflow.models.fuel_statement_import import _match_trips
+
+
+@tagged('post_install', '-at_install')
+class TestMatchTrips(BaseCase):
+
+    def _match(self, rows, trips):
+        transactions = [{'vehicle_id': v, 'date': d} for v, d in rows]
+        _match_trips(transactions, trips)
+        return [t['trip_id'] for t in transactions]
+
+    def test_interleaved_vehicles(self):
+        """Trips ordered by vehicle name, not id, must not be dropped."""
+        trips = [
+            (1, date(2026, 1, 1), date(2026, 1, 2), 10),
+            (2, date(2026, 1, 1), date(2026, 1, 3), 20),
+            (1, date(2026, 1, 5), date(2026, 1, 6), 11),
+        ]
+        rows = [(1, date(2026, 1, 1)), (1, date(2026, 1, 5)), (2, date(2026, 1, 2))]
+        self.assertEqual(self._match(rows, trips), [10, 11, 20])
+
+    def test_row_before_first_trip(self):
+        trips = [(1, date(2026, 1, 5), date(2026, 1, 6), 10)]
+        self.assertEqual(self._match([(1, date(2026, 1, 4))], trips), [False])
+
+    def test_row_on_completion_day(self):
+        trips = [(1, date(2026, 1, 1), date(2026, 1, 3), 10)]
+        rows = [(1, date(2026, 1, 3)), (1, date(2026, 1, 4))]
+        self.assertEqual(self._match(rows, trips), [10, False])
+
+    def test_open_dispatched_trip(self):
+        """Dispatched trips run until the statement's last date."""
+        statement_end = date(2026, 1, 9)
+        trips = [
+            (1, date(2026, 1, 1), date(2026, 1, 2), 10),
+            (1, date(2026, 1, 4), statement_end, 11),
+        ]
+        rows = [(1, date(2026, 1, 3)), (1, date(2026, 1, 4)), (1, statement_end)]
+        self.assertEqual(self._match(rows, trips), [False, 11, 11])
+
+    def test_unknown_vehicle(self):
+        trips = [(1, date(2026, 1, 1), date(2026, 1, 3), 10)]
+        self.assertEqual(self._match([(2, date(2026, 1, 2))], trips), [False])
+
+
+STATEMENT = """ Date ,LICENSE_PLATE, Liters ,Price_Per_Liter,Amount,Reference,Station
+2026-01-02,gj 01 ab 1234,40,100,3990,R1,Shell
+02/01/2026,GJ01AB1234,10,100,1000,R2,
+2026-01-10,GJ01AB1234,10,100,1000,R3,
+2026-01-02,XX99,10,100,1000,R4,
+2026-01-02,GJ01AB1234,10,100,1000,R1,
+not-a-date,GJ01AB1234,10,100,1000,R5,
+"""
+
+
+@tagged('post_install', '-at_install')
+class TestFuelStatementImport(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vehicle = cls.env['fleetflow.vehicle'].create({
+            'name': 'Tata Ace',
+            'license_plate': 'GJ-01-AB-1234',
+            'max_load_capacity': 1000,
+        })
+        cls.driver = cls.env['fleetflow.driver'].create({
+            'name': 'Ravi Patel',
+            'license_number': 'GJ-DL-0001',
+            'license_expiry_date': date(2099, 1, 1),
+        })
+        cls.trip = cls.env['fleetflow.trip'].create({
+            'vehicle_id': cls.vehicle.id,
+            'driver_id': cls.driver.id,
+            'origin': 'Ahmedabad',
+            'destination': 'Surat',
+            'cargo_weight': 500,
+            'date_planned': date(2026, 1, 1),
+        })
+        cls.trip.write({'state': 'completed', 'date_completed': date(2026, 1, 3)})
+
+    def _reconcile(self, require_trip=False):
+        wizard = self.env['fleetflow.fuel.statement.import'].create({
+            'statement_file': base64.b64encode(STATEMENT.encode()),
+            'require_trip': require_trip,
+        })
+        wizard.action_reconcile()
+        reasons = {}
+        if wizard.exception_file:
+            report = base64.b64decode(wizard.exception_file).decode()
+            for row in csv.DictReader(io.StringIO(report)):
+                reasons[int(row['line'])] = row['reason']
+        return wizard, reasons
+
+    def _expense(self, reference):
+        return self.env['fleetflow.expense'].search(
+            [('card_reference', '=', reference)])
+
+    def test_reconcile(self):
+        wizard, reasons = self._reconcile()
+        self.assertEqual(
+            (wizard.rows_total, wizard.rows_imported, wizard.rows_matched_trip),
+            (6, 3, 2))
+
+        r1 = self._expense('R1')
+        self.assertEqual(r1.trip_id, self.trip)
+        self.assertEqual(r1.vehicle_id, self.vehicle)
+        self.assertEqual(r1.cost, 3990, 'cost is the statement amount')
+        self.assertEqual(r1.name, 'Fuel — Shell')
+        self.assertEqual(self._expense('R2').trip_id, self.trip,
+                         'day-first dates are parsed')
+        self.assertFalse(self._expense('R3').trip_id)
+
+        self.assertEqual(reasons[5], 'Unknown license plate')
+        self.assertEqual(reasons[6], 'Duplicate reference in statement')
+        self.assertTrue(reasons[7].startswith('Unreadable row'))
+        self.assertEqual(set(reasons), {5, 6, 7})
+        self.assertFalse(self._expense('R4') | self._expense('R5'))
+
+    def test_second_run_already_imported(self):
+        self._reconcile()
+        wizard, reasons = self._reconcile()
+        self.assertEqual(wizard.rows_imported, 0)
+        for line in (2, 3, 4):
+            self.assertEqual(reasons[line], 'Already imported')
+        self.assertEqual(len(self._expense('R1')), 1)
+
+    def test_require_trip(self):
+        wizard, reasons = self._reconcile(require_trip=True)
+        self.assertEqual(wizard.rows_imported, 2)
+        self.assertEqual(reasons[4], 'No trip on this date')
+        self.assertFalse(self._expense('R3'))
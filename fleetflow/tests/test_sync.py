@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+from datetime import date, datetime
+from urllib.parse import urlencode
+
+from odoo.tests import HttpCase, new_test_user, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestDriverSync(HttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = new_test_user(cls.env, login='ff_driver', groups='base.group_user')
+        employee = cls.env['hr.employee'].create({
+            'name': 'Ravi Patel', 'user_id': cls.user.id})
+        cls.driver = cls.env['fleetflow.driver'].create({
+            'name': 'Ravi Patel',
+            'license_number': 'GJ-DL-0001',
+            'license_expiry_date': date(2099, 1, 1),
+            'employee_id': employee.id,
+        })
+        cls.other_driver = cls.env['fleetflow.driver'].create({
+            'name': 'Meena Shah',
+            'license_number': 'GJ-DL-0002',
+            'license_expiry_date': date(2099, 1, 1),
+        })
+        cls.vehicle = cls.env['fleetflow.vehicle'].create({
+            'name': 'Tata Ace',
+            'license_plate': 'GJ-01-AB-1234',
+            'max_load_capacity': 1000,
+        })
+        cls.trips = cls.env['fleetflow.trip'].create([{
+            'vehicle_id': cls.vehicle.id,
+            'driver_id': cls.driver.id,
+            'origin': 'Ahmedabad',
+            'destination': destination,
+            'cargo_weight': 500,
+        } for destination in ('Surat', 'Vadodara', 'Rajkot')])
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate('ff_driver', 'ff_driver')
+
+    def _pull(self, **params):
+        self.env.flush_all()
+        response = self.url_open('/fleetflow/sync/pull?' + urlencode(params))
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def _resume(self, page, **params):
+        return self._pull(**page['watermark'], **params)
+
+    def _trip_ids(self, page):
+        ids = page['trips']['fields'].index('id')
+        return [row[ids] for row in page['trips']['rows']]
+
+    def _push(self, completions):
+        self.env.flush_all()
+        results = self.make_jsonrpc_request(
+            '/fleetflow/sync/push', {'completions': completions})['results']
+        self.env.invalidate_all()
+        return results
+
+    def test_paging_and_horizon(self):
+        first = self._pull(limit=2)
+        self.assertTrue(first['has_more'])
+        self.assertFalse(first['reset'])
+        self.assertEqual(first['watermark']['trip_id'], self._trip_ids(first)[-1],
+                         'mid-stream pages return the exact last key')
+
+        last = self._resume(first, limit=2)
+        self.assertFalse(last['has_more'])
+        self.assertEqual(sorted(self._trip_ids(first) + self._trip_ids(last)),
+                         sorted(self.trips.ids))
+
+        # The final page settles behind every row it returned, so a late
+        # commit stamped inside the overlap window is read again.
+        mark = datetime.fromisoformat(last['watermark']['trip_write_date'])
+        self.assertEqual(last['watermark']['trip_id'], 0)
+        self.assertLess(mark, min(self.trips.mapped('write_date')))
+        self.assertEqual(sorted(self._trip_ids(self._resume(last))),
+                         sorted(self.trips.ids))
+
+    def test_reassignment_tombstones(self):
+        trip = self.trips[0]
+        trip.driver_id = self.other_driver
+        page = self._pull()
+        self.assertIn(['fleetflow.trip', trip.id], page['tombstones'])
+        self.assertNotIn(trip.id, self._trip_ids(page))
+
+        trip.driver_id = self.driver
+        page = self._pull()
+        self.assertNotIn(['fleetflow.trip', trip.id], page['tombstones'],
+                         'a trip reassigned back is not deleted again')
+        self.assertIn(trip.id, self._trip_ids(page))
+
+    def test_stale_watermark_resets(self):
+        page = self._pull(trip_write_date='2000-01-01 00:00:00', trip_id=1,
+                          tombstone_date='2000-01-01 00:00:00', tombstone_id=1)
+        self.assertTrue(page['reset'])
+        self.assertEqual(sorted(self._trip_ids(page)), sorted(self.trips.ids))
+
+    def test_malformed_watermark(self):
+        for query in ('trip_write_date=yesterday', 'trip_write_date=2026-01-01&trip_id=x',
+                      'limit=many', 'tombstone_date=2026-01-01T00:00:00%2B05:30'):
+            response = self.url_open('/fleetflow/sync/pull?' + query)
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_push_replay(self):
+        trip = self.trips[0]
+        trip.action_dispatch()
+        batch = [{'trip_id': trip.id, 'odometer_start': 1000, 'odometer_end': 1250}]
+        self.assertEqual(self._push(batch)[0]['status'], 'completed')
+        self.assertEqual(trip.state, 'completed')
+        self.assertEqual(trip.distance_km, 250)
+        self.assertEqual(self.vehicle.odometer, 1250)
+        self.assertEqual(self._push(batch)[0]['status'], 'already_completed')
+
+    def test_push_malformed_entries(self):
+        trip = self.trips[1]
+        trip.action_dispatch()
+        results = self._push([
+            {'trip_id': trip.id},
+            'not-an-entry',
+            {'trip_id': trip.id, 'odometer_end': 'far'},
+        ])
+        self.assertEqual([r['status'] for r in results], ['error'] * 3)
+        self.assertEqual(trip.state, 'dispatched')